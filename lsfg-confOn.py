@@ -1,11 +1,25 @@
 import gi
 gi.require_version("Gtk", "3.0")
 from gi.repository import Gtk, Gdk
+import difflib
+import glob
 import os
 import re
+import shlex
 import vdf
 
 CONFIG_PATH = os.path.expanduser("~/.config/lsfg-vk/conf.toml")
+STEAM_ROOT_PATH = os.path.expanduser("~/.steam/steam")
+
+DEFAULT_GAME_ENTRY = {
+    "exe": "", "multiplier": 2, "flow_scale": 1.0, "fps_limit": 48,
+    "performance_mode": False, "hdr_mode": False, "mangohud": False,
+    "steamdeck_compat": False, "enable_gamescope_wsi": None,
+    "present_mode": "fifo"
+}
+
+# localconfig.vdf 안에서 앱별 실행 옵션이 들어있는 경로 (Steam 버전에 따라 대소문자가 다름)
+LAUNCH_OPTIONS_APPS_PATH = ("userlocalconfigstore", "software", "valve", "steam", "apps")
 
 class ConfigEditor(Gtk.Window):
     def __init__(self):
@@ -34,6 +48,10 @@ class ConfigEditor(Gtk.Window):
         search_steam_games_btn.connect("clicked", self.on_search_steam_games_clicked)
         button_box.pack_start(search_steam_games_btn, False, False, 0)
 
+        import_btn = Gtk.Button(label="실행옵션 가져오기")
+        import_btn.connect("clicked", self.on_import_launch_options_clicked)
+        button_box.pack_start(import_btn, False, False, 0)
+
         remove_btn = Gtk.Button(label="현재 게임 삭제")
         remove_btn.connect("clicked", self.remove_current_tab)
         button_box.pack_start(remove_btn, False, False, 0)
@@ -55,24 +73,17 @@ class ConfigEditor(Gtk.Window):
             return []
 
     def extract_game_entries(self):
-        entries, current = [], {
-            "exe": "", "multiplier": 2, "flow_scale": 1.0, "fps_limit": 48,
-            "performance_mode": False, "hdr_mode": False, "mangohud": False,
-            "steamdeck_compat": False, "enable_gamescope_wsi": None,
-            "present_mode": "fifo"
-        }
+        entries, current = [], DEFAULT_GAME_ENTRY.copy()
         for line in self.config_lines:
             line = line.strip()
             if line.startswith("[[game]]"):
                 if current["exe"]: entries.append(current.copy())
-                current.update({
-                    "exe": "", "multiplier": 2, "flow_scale": 1.0, "fps_limit": 48,
-                    "performance_mode": False, "hdr_mode": False, "mangohud": False,
-                    "steamdeck_compat": False, "enable_gamescope_wsi": None,
-                    "present_mode": "fifo"
-                })
+                current.update(DEFAULT_GAME_ENTRY)
             elif line.startswith("exe ="):
-                current["exe"] = line.split("=", 1)[1].strip().strip('"')
+                value = line.split("=", 1)[1].strip()
+                if len(value) >= 2 and value.startswith('"') and value.endswith('"'):
+                    value = re.sub(r'\\(.)', r'\1', value[1:-1]) # TOML 문자열의 \\, \" 이스케이프 해제
+                current["exe"] = value
             elif line.startswith("multiplier ="):
                 try:
                     current["multiplier"] = int(line.split("=", 1)[1].strip())
@@ -123,12 +134,7 @@ class ConfigEditor(Gtk.Window):
             self.add_game_tab()
 
     def add_game_tab(self, entry=None):
-        data = {
-            "exe": "", "multiplier": 2, "flow_scale": 1.0, "fps_limit": 48,
-            "performance_mode": False, "hdr_mode": False, "mangohud": False,
-            "steamdeck_compat": False, "enable_gamescope_wsi": None,
-            "present_mode": "fifo"
-        }
+        data = DEFAULT_GAME_ENTRY.copy()
         if isinstance(entry, dict):
             data.update(entry) 
 
@@ -217,56 +223,75 @@ class ConfigEditor(Gtk.Window):
             if not self.pages:
                 self.add_game_tab()
 
-    def save_config(self, _):
-        config_dir = os.path.dirname(CONFIG_PATH)
-        if not os.path.exists(config_dir):
-            os.makedirs(config_dir)
-
-        new_lines = [
-            "version = 1\n",
-            "[global]\n",
-            '# override the location of Lossless Scaling\n',
-            '# dll = "/games/Lossless Scaling"\n\n'
-        ]
-
+    def collect_page_entries(self):
+        entries = []
         for widgets in self.pages:
             exe = widgets["exe"].get_text().strip()
             if not exe:
                 continue
+            entries.append({
+                "exe": exe,
+                "multiplier": int(widgets["multiplier"].get_value()),
+                "flow_scale": widgets["flow_scale"].get_value(),
+                "fps_limit": int(widgets["fps_limit"].get_value()),
+                "performance_mode": widgets["performance_mode"].get_active(),
+                "hdr_mode": widgets["hdr_mode"].get_active(),
+                "mangohud": widgets["mangohud"].get_active(),
+                "steamdeck_compat": widgets["steamdeck_compat"].get_active(),
+                "enable_gamescope_wsi": widgets["enable_gamescope_wsi"].get_active(),
+                "present_mode": widgets["present_mode"].get_active_text(),
+            })
+        return entries
 
-            mult = int(widgets["multiplier"].get_value())
-            flow = widgets["flow_scale"].get_value()
-            fps = int(widgets["fps_limit"].get_value())
-            perf = "true" if widgets["performance_mode"].get_active() else "false"
-            hdr = "true" if widgets["hdr_mode"].get_active() else "false"
-            mango = "true" if widgets["mangohud"].get_active() else "false"
-            
-            steamdeck_compat_active = widgets["steamdeck_compat"].get_active()
-            enable_gamescope_wsi_active = widgets["enable_gamescope_wsi"].get_active()
+    def build_config_lines(self, entries):
+        return [
+            "version = 1\n",
+            "[global]\n",
+            '# override the location of Lossless Scaling\n',
+            '# dll = "/games/Lossless Scaling"\n\n'
+        ] + self.build_game_lines(entries)
 
-            present = widgets["present_mode"].get_active_text()
+    def build_game_lines(self, entries):
+        new_lines = []
+        for entry in entries:
+            # 실행 옵션에서 가져온 exe에 \ 나 " 가 있어도 TOML이 깨지지 않도록 이스케이프
+            exe = entry["exe"].replace("\\", "\\\\").replace('"', '\\"')
+            perf = "true" if entry["performance_mode"] else "false"
+            hdr = "true" if entry["hdr_mode"] else "false"
+            mango = "true" if entry["mangohud"] else "false"
 
             new_lines.extend([
                 "[[game]]\n",
                 f'exe = "{exe}"\n',
-                f"multiplier = {mult}\n",
-                f"flow_scale = {flow:.2f}\n",
-                f"experimental_fps_limit = {fps}\n",
+                f"multiplier = {entry['multiplier']}\n",
+                f"flow_scale = {entry['flow_scale']:.2f}\n",
+                f"experimental_fps_limit = {entry['fps_limit']}\n",
                 f"performance_mode = {perf}\n",
                 f"hdr_mode = {hdr}\n",
                 f"mangohud = {mango}\n",
             ])
             
             # Steam Deck 호환 모드는 env로 저장
-            new_lines.append(f'env = "SteamDeck={"1" if steamdeck_compat_active else "0"}"\n')
+            new_lines.append(f'env = "SteamDeck={"1" if entry["steamdeck_compat"] else "0"}"\n')
 
             # ENABLE_GAMESCOPE_WSI는 체크 시에만 0으로 저장
-            if enable_gamescope_wsi_active:
+            if entry["enable_gamescope_wsi"]:
                 new_lines.append(f"enable_gamescope_wsi = 0\n") 
             
-            new_lines.append(f'experimental_present_mode = "{present}"\n')
+            new_lines.append(f'experimental_present_mode = "{entry["present_mode"]}"\n')
             new_lines.append("\n")
 
+        return new_lines
+
+    def save_config(self, _):
+        config_dir = os.path.dirname(CONFIG_PATH)
+        if not os.path.exists(config_dir):
+            os.makedirs(config_dir)
+
+        new_lines = self.build_config_lines(self.collect_page_entries())
+        self.write_config_lines(new_lines)
+
+    def write_config_lines(self, new_lines):
         try:
             os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
             with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
@@ -282,6 +307,7 @@ class ConfigEditor(Gtk.Window):
             dialog.format_secondary_text(f"설정 파일이 성공적으로 저장되었습니다:\n{CONFIG_PATH}")
             dialog.run()
             dialog.destroy()
+            return True
 
         except Exception as e:
             print(f"설정 저장 중 오류 발생: {e}")
@@ -295,9 +321,223 @@ class ConfigEditor(Gtk.Window):
             dialog.format_secondary_text(f"설정 파일 저장 중 오류가 발생했습니다:\n{e}\n\n권한 문제일 수 있습니다.")
             dialog.run()
             dialog.destroy()
+            return False
+
+    def scan_launch_options(self):
+        """모든 userdata/*/config/localconfig.vdf를 한 번씩만 읽어 ({appid: [[game]] 항목}, 계정 간 값이 다른 appid 목록)을 반환"""
+        parsed, seen_options = {}, {}
+        pattern = os.path.join(STEAM_ROOT_PATH, "userdata", "*", "config", "localconfig.vdf")
+        kv_re = re.compile(r'^\s*"((?:[^"\\]|\\.)*)"\s+"((?:[^"\\]|\\.)*)"')
+        key_re = re.compile(r'^\s*"((?:[^"\\]|\\.)*)"\s*$')
+
+        def unescape(value):
+            return re.sub(r'\\(.)', lambda m: {"n": "\n", "t": "\t"}.get(m.group(1), m.group(1)), value)
+
+        # 여러 Steam 계정이 같은 게임에 다른 실행 옵션을 가지면 LSFG 설정이 있는 값 중 가장 최근에 사용한 계정 값을 쓴다
+        for localconfig_path in sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True):
+            # 수 MB짜리 파일이라 vdf.load로 전체 트리를 만들지 않고 줄 단위로 흘려 읽는다
+            path, pending_key = [], None
+            depth = len(LAUNCH_OPTIONS_APPS_PATH)
+            try:
+                with open(localconfig_path, 'r', encoding='utf-8', errors='replace') as f:
+                    for line in f:
+                        stripped = line.strip()
+                        if stripped == "{":
+                            path.append(pending_key or "")
+                            pending_key = None
+                        elif stripped == "}":
+                            if path:
+                                path.pop()
+                        else:
+                            match = kv_re.match(line)
+                            if match:
+                                pending_key = None
+                                if (len(path) == depth + 1
+                                        and tuple(p.lower() for p in path[:depth]) == LAUNCH_OPTIONS_APPS_PATH
+                                        and match.group(1).lower() == "launchoptions"):
+                                    appid = path[depth]
+                                    value = unescape(match.group(2)).strip()
+                                    if value:
+                                        seen_options.setdefault(appid, set()).add(value)
+                                        if appid not in parsed:
+                                            entry = self.parse_launch_options(value)
+                                            if entry is not None:
+                                                parsed[appid] = entry
+                                continue
+                            match = key_re.match(line)
+                            if match:
+                                pending_key = match.group(1).lower() if len(path) < depth else match.group(1)
+            except Exception as e:
+                print(f"Error reading {localconfig_path}: {e}")
+
+        return parsed, [appid for appid in parsed if len(seen_options[appid]) > 1]
+
+    def parse_launch_options(self, options):
+        """LSFGo.html 형식의 실행 옵션 문자열을 [[game]] 항목(dict)으로 변환. LSFG 설정이 없으면 None"""
+        try:
+            tokens = shlex.split(options)
+        except ValueError:
+            tokens = options.split()
+
+        env, words = {}, set()
+        for token in tokens:
+            if token.lower() == "%command%":
+                break
+            if "=" in token:
+                key, value = token.split("=", 1)
+                env[key.upper()] = value
+            else:
+                words.add(os.path.basename(token).lower())
+
+        if env.get("ENABLE_LSFG") != "1" and env.get("LSFG_LEGACY") != "1":
+            return None
+
+        entry = DEFAULT_GAME_ENTRY.copy()
+        entry["exe"] = env.get("LSFG_PROCESS", "")
+        try:
+            entry["multiplier"] = min(max(int(env.get("LSFG_MULTIPLIER", entry["multiplier"])), 1), 4)
+        except ValueError:
+            pass
+        try:
+            entry["flow_scale"] = min(max(float(env.get("LSFG_FLOW_SCALE", entry["flow_scale"])), 0.25), 1.0)
+        except ValueError:
+            pass
+        entry["performance_mode"] = "1" in (env.get("PERFORMANCE_MODE"), env.get("LSFG_PERF_MODE"))
+        entry["hdr_mode"] = env.get("LSFG_HDR") == "1"
+        entry["mangohud"] = "mangohud" in words or env.get("MANGOHUD") == "1"
+        entry["steamdeck_compat"] = env.get("STEAMDECK") == "1"
+        # GUI 체크박스와 같은 의미: 체크 = ENABLE_GAMESCOPE_WSI=0 으로 저장
+        entry["enable_gamescope_wsi"] = env.get("ENABLE_GAMESCOPE_WSI") == "0"
+        if env.get("MESA_VK_WSI_PRESENT_MODE") in ("fifo", "immediate", "mailbox", "relaxed"):
+            entry["present_mode"] = env["MESA_VK_WSI_PRESENT_MODE"]
+        return entry
+
+    def find_app_install_dirs(self, appids):
+        """appmanifest_<appid>.acf에서 installdir을 읽어 {appid: installdir} 반환"""
+        install_dirs = {}
+        steamapps_paths = [os.path.dirname(common) for common in self.find_steam_library_folders()]
+        for appid in appids:
+            for steamapps_path in steamapps_paths:
+                manifest_path = os.path.join(steamapps_path, f"appmanifest_{appid}.acf")
+                if not os.path.exists(manifest_path):
+                    continue
+                try:
+                    with open(manifest_path, 'r', encoding='utf-8') as f:
+                        app_state = vdf.load(f).get("AppState", {})
+                    if app_state.get("installdir"):
+                        install_dirs[appid] = app_state["installdir"]
+                        break
+                except Exception as e:
+                    print(f"Error reading {manifest_path}: {e}")
+        return install_dirs
+
+    def import_launch_option_entries(self):
+        """실행 옵션에서 LSFG 설정을 가진 게임들을 찾아 ([[game]] 항목 목록, 설치 폴더를 못 찾은 appid 목록, 계정 간 값이 다른 appid 목록) 반환"""
+        parsed, conflicts = self.scan_launch_options()
+        install_dirs = self.find_app_install_dirs([appid for appid, entry in parsed.items() if not entry["exe"]])
+        entries, skipped = [], []
+        for appid, entry in parsed.items():
+            if not entry["exe"]:
+                entry["exe"] = install_dirs.get(appid, "")
+            if entry["exe"]:
+                entries.append(entry)
+            else:
+                skipped.append(appid)
+        return entries, skipped, conflicts
+
+    def on_import_launch_options_clicked(self, button):
+        # 탭의 저장하지 않은 변경 내용은 건드리지 않도록 디스크의 conf.toml을 기준으로 병합한다
+        self.config_lines = self.load_raw_config()
+        existing_exes = {entry["exe"] for entry in self.extract_game_entries()}
+        imported_entries, skipped, conflicts = self.import_launch_option_entries()
+        new_entries = []
+        for entry in imported_entries:
+            if entry["exe"] not in existing_exes:
+                existing_exes.add(entry["exe"])
+                new_entries.append(entry)
+
+        notes = []
+        if skipped:
+            notes.append(f"설치 폴더를 찾을 수 없어 건너뛴 App ID ({len(skipped)}개): {', '.join(skipped)}")
+        if conflicts:
+            notes.append(f"계정마다 실행 옵션이 달라 LSFG 설정이 있는 최근 사용 계정 값을 사용한 App ID: {', '.join(conflicts)}")
+
+        if not new_entries:
+            dialog = Gtk.MessageDialog(
+                parent=self,
+                flags=0,
+                message_type=Gtk.MessageType.INFO,
+                buttons=Gtk.ButtonsType.OK,
+                text="가져올 게임 없음",
+            )
+            dialog.format_secondary_text("\n\n".join(
+                ["Steam 실행 옵션에서 새로 가져올 LSFG 설정을 찾을 수 없습니다."] + notes
+            ))
+            dialog.run()
+            dialog.destroy()
+            return
+
+        new_lines = list(self.config_lines) or self.build_config_lines([])
+        if not new_lines[-1].endswith("\n"):
+            new_lines[-1] += "\n"
+        if new_lines[-1].strip():
+            new_lines.append("\n")
+        new_lines += self.build_game_lines(new_entries)
+        diff = "".join(difflib.unified_diff(
+            self.config_lines, new_lines, fromfile=CONFIG_PATH, tofile=CONFIG_PATH + " (가져오기 후)"
+        ))
+
+        # 적용 전에 conf.toml 변경 내용을 미리 보여준다 (dry-run)
+        title = f"실행옵션 가져오기 - {len(new_entries)}개 게임"
+        if skipped:
+            title += f", {len(skipped)}개 건너뜀"
+        preview_dialog = Gtk.Dialog(
+            title=title,
+            parent=self,
+            flags=0,
+            buttons=(Gtk.STOCK_CANCEL, Gtk.ResponseType.CANCEL,
+                     Gtk.STOCK_APPLY, Gtk.ResponseType.OK)
+        )
+        preview_dialog.set_default_size(700, 500)
+
+        summary_label = Gtk.Label(label="\n".join(
+            [f"{len(new_entries)}개 게임을 conf.toml 끝에 추가합니다. 기존 항목은 그대로 두며, 탭에서 저장하지 않은 변경 내용은 함께 저장되지 않습니다."] + notes
+        ), xalign=0)
+        summary_label.set_line_wrap(True)
+        summary_label.set_selectable(True)
+        preview_dialog.get_content_area().pack_start(summary_label, False, False, 0)
+
+        scrolled_window = Gtk.ScrolledWindow()
+        scrolled_window.set_vexpand(True)
+        scrolled_window.set_hexpand(True)
+        preview_dialog.get_content_area().pack_start(scrolled_window, True, True, 0)
+
+        diff_view = Gtk.TextView()
+        diff_view.set_editable(False)
+        diff_view.set_monospace(True)
+        diff_view.get_buffer().set_text(diff)
+        scrolled_window.add(diff_view)
+
+        preview_dialog.show_all()
+        response = preview_dialog.run()
+        preview_dialog.destroy()
+
+        if response != Gtk.ResponseType.OK:
+            return
+
+        if not self.write_config_lines(new_lines):
+            return
+        self.config_lines = self.load_raw_config()
+        self.game_entries = self.extract_game_entries()
+
+        # 열려 있는 탭은 그대로 두고 새로 가져온 게임만 탭으로 추가
+        open_exes = {widgets["exe"].get_text().strip() for widgets in self.pages}
+        for entry in new_entries:
+            if entry["exe"] not in open_exes:
+                self.add_game_tab(entry)
 
     def find_steam_library_folders(self):
-        steam_root_path = os.path.expanduser("~/.steam/steam")
+        steam_root_path = STEAM_ROOT_PATH
         libraryfolders_vdf_path = os.path.join(steam_root_path, "steamapps", "libraryfolders.vdf")
 
         library_paths = []